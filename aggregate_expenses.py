@@ -1,18 +1,55 @@
 import os
 import re
+import argparse
+import functools
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-import mplcursors  # <-- for interactive annotations
 import numpy as np
 
+try:
+    import pyarrow  # noqa: F401  <-- optional, enables the parquet cache
+except ImportError:
+    pyarrow = None
+
+# HEADLESS=1 (or true/yes) in the environment saves charts as PNGs (Agg
+# backend, no GUI), same as the --save flag; HEADLESS=0/false/no doesn't
+HEADLESS = os.environ.get('HEADLESS', '').strip().lower() in ('1', 'true', 'yes')
+
+# Plotting modules, imported on first use by _mpl()
+plt = None
+ticker = None
+
+def _mpl():
+    """
+    Imports matplotlib the first time a chart is drawn, so importing this
+    module (or a run that never plots) doesn't pay its start-up cost.
+    """
+    global plt, ticker
+    if plt is None:
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as ticker
+    return plt, ticker
+
+_HEBREW_RE = re.compile(r'^[\u0590-\u05FF]+\Z')
+_SPECIAL = frozenset('"-/')
+
+@functools.lru_cache(maxsize=8192)
 def is_all_hebrew(word: str) -> bool:
     """
     Returns True if 'word' consists ONLY of Hebrew letters (\u0590-\u05FF).
     Otherwise False (digits, punctuation, or mixing => not purely Hebrew).
     """
-    return bool(re.match(r'^[\u0590-\u05FF]+$', word)) or word.__contains__('"') or word.__contains__('-') or word.__contains__('/')
+    # Only run the regex when the first character is Hebrew at all
+    if word and '\u0590' <= word[0] <= '\u05FF' and _HEBREW_RE.match(word):
+        return True
+    return not _SPECIAL.isdisjoint(word)
+
+def _has_hebrew(s: str) -> bool:
+    """
+    Returns True if 's' contains at least one Hebrew code point (\u0590-\u05FF).
+    """
+    return any('\u0590' <= c <= '\u05FF' for c in s)
 
+@functools.lru_cache(maxsize=8192)
 def reverse_line_hebrew_words_and_order(line: str) -> str:
     """
     1) Split 'line' by spaces into tokens.
@@ -24,7 +61,10 @@ def reverse_line_hebrew_words_and_order(line: str) -> str:
       "שלום עולם" => ["שלום", "עולם"] => reverse => ["עולם", "שלום"] 
                      => reverse letters => ["םלוע", "םולש"] => "םלוע םולש"
       "שלום123" => single token with digits => unchanged => "שלום123"
+      "HOT MOBILE" => no Hebrew at all => returned as-is
     """
+    if not _has_hebrew(line):
+        return line
     tokens = line.split()
     # Reverse the overall word order
     tokens.reverse()
@@ -50,39 +90,88 @@ def format_int_no_decimals(value):
         return "<1"
     return f"{value:,.0f}"
 
-def custom_bar_percentage(value, total_sum):
+def format_many(arr):
+    """
+    Vectorized format_int_no_decimals: formats a whole numeric array at once.
+    Returns an object ndarray of strings, e.g. [1234.56, 0.3] -> ['1,235', '<1'].
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    rounded = np.rint(arr).astype(np.int64)
+    base = np.array([f"{v:,}" for v in rounded.tolist()], dtype=object)
+    small = (arr > 0) & (arr < 1)
+    base[small] = "<1"
+    return base
+
+def format_series(s):
     """
-    Computes the percentage of 'value' relative to 'total_sum'.
-      - If total_sum == 0, returns '0%'
-      - If < 0.5%, returns '<1%'
+    format_many for a pandas Series: keeps the index, so the result lines up
+    when concatenated with other columns of the same frame. The result has
+    the same str dtype as '.astype(str)' columns, so '+' works even when empty.
+    """
+    return pd.Series(format_many(s.to_numpy()), index=s.index, dtype=str)
+
+def format_pcts(values, total_sum):
+    """
+    Computes the percentage of every entry of 'values' relative to 'total_sum',
+    in one NumPy pass:
+      - If total_sum == 0, every entry is '0%'
+      - If 0 < pct < 0.5, '<1%'
       - Otherwise, round to nearest integer, e.g. '12%'.
+    Returns a list of strings, e.g. ['12%', '<1%'].
     """
+    values = np.asarray(values, dtype=np.float64)
     if total_sum == 0:
-        return "0%"
-    pct = (value / total_sum) * 100
-    return "<1%" if (0 < pct < 0.5) else f"{pct:.0f}%"
+        return ["0%"] * len(values)
+    pct = values / total_sum * 100.0
+    out = np.char.add(np.rint(pct).astype(np.int64).astype(str), "%").astype(object)
+    out[(pct > 0) & (pct < 0.5)] = "<1%"
+    return out.tolist()
 
-def custom_slice_label(slice_label, slice_value, slice_pct):
+def make_autopct(slice_labels):
     """
-    Builds a multi-line string for each pie slice:
-      1) The label (category/business name)
-      2) The absolute value (comma-separated, no decimals, or <1)
-      3) The percentage, e.g., '12%' or '<1%'
+    Returns an 'autopct' callable for ax.pie that hands out the prebuilt
+    'slice_labels' in wedge order (ax.pie calls it once per wedge), so the
+    labels are placed inside the wedges without any per-slice formatting.
     """
-    value_str = format_int_no_decimals(slice_value)
-    return f"{slice_label}\n{value_str}\n({slice_pct})"
+    it = iter(slice_labels)
+    return lambda pct: next(it)
 
-def plot_bar_chart(labels, values, title_label):
+def show_or_save(fig, title_label, kind, save=False):
+    """
+    Shows 'fig' in a window, or with save=True writes it to
+    '<title_label>_<kind>.png'. Either way the figure is closed afterwards
+    so its canvas/renderer memory is released.
+    Returns the saved path, or None when shown.
+    """
+    _mpl()
+    path = None
+    if save:
+        path = f"{title_label.replace(' ', '_')}_{kind}.png"
+        fig.savefig(path, dpi=100, bbox_inches='tight')
+    else:
+        plt.show()
+    plt.close(fig)
+    return path
+
+def plot_bar_chart(labels, values, title_label, save=False, ax=None):
     """
     Normal bar chart for e.g. 'Business Name' (without interactive details).
+    Draws into 'ax' when given (the caller shows/saves that figure);
+    otherwise into a figure of its own, which is shown or saved here.
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
+    _mpl()
+    labels = np.asarray(labels, dtype=object)
+    values = np.asarray(values, dtype=np.float64)
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(8, 5), layout='constrained')
     bars = ax.bar(labels, values, color='skyblue')
 
     ax.set_title(f"{title_label} - Bar Chart")
     ax.set_xlabel(title_label)
     ax.set_ylabel('Total Expense')
-    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.set_xticks(np.arange(len(labels)))
+    ax.set_xticklabels(list(labels), rotation=45, ha='right')
 
     # Format Y-axis as comma-separated integers
     ax.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
@@ -90,20 +179,10 @@ def plot_bar_chart(labels, values, title_label):
     total_sum = values.sum()
 
     # Label each bar: absolute value + percentage
-    for bar in bars:
-        height = bar.get_height()
-        x_position = bar.get_x() + bar.get_width() / 2
-        val_str = format_int_no_decimals(height)
-        pct_str = custom_bar_percentage(height, total_sum)
-        label_text = f"{val_str}\n({pct_str})"
-        ax.text(
-            x_position,
-            height,
-            label_text,
-            ha='center',
-            va='bottom',
-            fontsize=9
-        )
+    val_strs = format_many(values)
+    pct_strs = format_pcts(values, total_sum)
+    labels_txt = [f"{v}\n({p})" for v, p in zip(val_strs, pct_strs)]
+    ax.bar_label(bars, labels=labels_txt, padding=2, fontsize=9)
 
     # Show "Total: X" in the top-right corner
     total_str = format_int_no_decimals(total_sum)
@@ -117,24 +196,32 @@ def plot_bar_chart(labels, values, title_label):
         fontweight='bold'
     )
 
-    plt.tight_layout()
-    plt.show()
-
-def plot_bar_chart_with_details(labels, values, title_label, category_details):
-    labels = labels.reset_index(drop=True)
+    if not own_fig:
+        return None
+    return show_or_save(fig, title_label, 'bar', save)
 
+def plot_bar_chart_with_details(labels, values, title_label, category_details, save=False, ax=None):
     """
     Bar chart specifically for 'Category' with an interactive annotation on click.
     category_details: dict mapping category_name -> list of (business, expense_str)
     Using NAIVE reversal for Hebrew text in the annotation popup.
+    Draws into 'ax' when given (the caller shows/saves that figure);
+    otherwise into a figure of its own, which is shown or saved here.
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
+    import mplcursors  # <-- for interactive annotations, only needed here
+    _mpl()
+    labels = np.asarray(labels, dtype=object)
+    values = np.asarray(values, dtype=np.float64)
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(8, 5), layout='constrained')
     bars = ax.bar(labels, values, color='skyblue')
 
     ax.set_title(f"{title_label} - Bar Chart (Interactive)")
     ax.set_xlabel(title_label)
     ax.set_ylabel('Total Expense')
-    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.set_xticks(np.arange(len(labels)))
+    ax.set_xticklabels(list(labels), rotation=45, ha='right')
 
     # Format Y-axis as comma-separated integers
     ax.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
@@ -142,20 +229,10 @@ def plot_bar_chart_with_details(labels, values, title_label, category_details):
     total_sum = values.sum()
 
     # Label each bar with absolute + percentage
-    for bar in bars:
-        height = bar.get_height()
-        x_position = bar.get_x() + bar.get_width() / 2
-        val_str = format_int_no_decimals(height)
-        pct_str = custom_bar_percentage(height, total_sum)
-        label_text = f"{val_str}\n({pct_str})"
-        ax.text(
-            x_position,
-            height,
-            label_text,
-            ha='center',
-            va='bottom',
-            fontsize=9
-        )
+    val_strs = format_many(values)
+    pct_strs = format_pcts(values, total_sum)
+    labels_txt = [f"{v}\n({p})" for v, p in zip(val_strs, pct_strs)]
+    ax.bar_label(bars, labels=labels_txt, padding=2, fontsize=9)
 
     # "Total: X" top-right
     total_str = format_int_no_decimals(total_sum)
@@ -172,53 +249,64 @@ def plot_bar_chart_with_details(labels, values, title_label, category_details):
     # --------------------------
     #  Use mplcursors for click
     # --------------------------
+    # Prebuild each bar's popup text once, so a click is just a lookup
+    annotations = [
+        "\n".join(
+            [f"Category: {cat_label}"]
+            # Also apply naive reversal to the business name
+            + [f"{reverse_line_hebrew_words_and_order(biz_name)} => {exp_str}"
+               for (biz_name, exp_str) in category_details.get(cat_label, [])]
+        )
+        for cat_label in labels
+    ]
+
     cursor = mplcursors.cursor(bars, hover=False)  # or hover=True if you want mouseover
 
     @cursor.connect("add")
     def on_add(sel):
-        print('------------------')
-        print(sel)
-        idx = sel.index
-        cat_label = labels[idx]
-        biz_info_list = category_details.get(cat_label, [])
-
-        # Build lines
-        lines = [f"Category: {cat_label}"]
-        for (biz_name, exp_str) in biz_info_list:
-            # Also apply naive reversal to the business name
-            biz_name_reversed = reverse_line_hebrew_words_and_order(biz_name)
-            lines.append(f"{biz_name_reversed} => {exp_str}")
-
-        # Join with newlines
-        detail_text = "\n".join(lines)
-
         # Set the annotation text to show these details
-        sel.annotation.set_text(detail_text)
+        sel.annotation.set_text(annotations[sel.index])
 
         # Optional styling
         sel.annotation.get_bbox_patch().set(fc="white", ec="black")
 
-    plt.tight_layout()
-    plt.show()
+    if not own_fig:
+        return None
+    return show_or_save(fig, title_label, 'bar', save)
 
-def plot_fraction_pie(labels, values, title_label):
+def plot_fraction_pie(labels, values, title_label, save=False, ax=None):
     """
     Pie chart with fraction-based wedge sizing.
+    Draws into 'ax' when given (the caller shows/saves that figure);
+    otherwise into a figure of its own, which is shown or saved here.
     """
+    _mpl()
+    labels = np.asarray(labels, dtype=object)
+    values = np.asarray(values, dtype=np.float64)
     total_sum = values.sum()
     if total_sum == 0:
         print(f"[INFO] No non-zero data for {title_label}, skipping pie chart.")
-        return
+        if ax is not None:
+            ax.set_axis_off()
+        return None
 
     fractions = values / total_sum
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(8, 5), layout='constrained')
+
+    # All slice labels at once: label, absolute value, percentage (same rules as the bars)
+    val_strs = format_many(values)
+    pct_strs = format_pcts(values, total_sum)
+    slice_labels = [f"{lbl}\n{v}\n({p})" for lbl, v, p in zip(labels, val_strs, pct_strs)]
 
-    wedges, texts, autotexts = ax.pie(
+    ax.pie(
         fractions,
         labels=None,
-        autopct='%0.0f%%',
-        startangle=140
+        autopct=make_autopct(slice_labels),
+        startangle=140,
+        textprops={'fontsize': 9}
     )
 
     ax.set_title(f"{title_label} - Pie Chart")
@@ -233,21 +321,100 @@ def plot_fraction_pie(labels, values, title_label):
         fontsize=12
     )
 
-    # Override each slice label
-    for i, autotext in enumerate(autotexts):
-        slice_label = labels[i]
-        slice_value = values[i]
-        pct_text = autotext.get_text().strip()
-        if pct_text == "0%":
-            pct_text = "<1%"
-        new_label = custom_slice_label(slice_label, slice_value, pct_text)
-        autotext.set_text(new_label)
-        autotext.set_fontsize(9)
-
-    plt.tight_layout()
-    plt.show()
-
-def main():
+    if not own_fig:
+        return None
+    return show_or_save(fig, title_label, 'pie', save)
+
+EXPENSES_PATH = 'input_expenses.xlsx'
+CATEGORIES_PATH = 'categories.xlsx'
+
+# buisness_name is read as 'string' in both workbooks, so numeric names stay
+# comparable keys; main() makes it categorical only after filtering
+EXPENSES_DTYPES = {'buisness_name': 'string', 'total_expense': 'float64'}
+CATEGORIES_DTYPES = {'buisness_name': 'string', 'category': 'string'}
+
+@functools.lru_cache(maxsize=4)
+def _parse_excel(path, mtime, dtypes):
+    """
+    Parses the first sheet of 'path', reading only the columns in 'dtypes'
+    (a tuple of (column, dtype) pairs) with those dtypes.
+    'mtime' is only part of the cache key, so an edited workbook is re-read;
+    the small bound evicts the frames of older versions.
+    The returned frame is shared by every hit - callers get a copy.
+    """
+    dtype = dict(dtypes)
+    with pd.ExcelFile(path, engine='openpyxl') as xls:
+        return xls.parse(
+            sheet_name=0,
+            usecols=list(dtype),
+            dtype=dtype,
+            parse_dates=False,
+            na_filter=True
+        )
+
+def _read_expenses(path=EXPENSES_PATH):
+    """
+    Returns the ['buisness_name', 'total_expense'] columns of the expenses workbook,
+    as a copy of the frame cached per (path, mtime).
+    """
+    return _parse_excel(path, os.path.getmtime(path), tuple(EXPENSES_DTYPES.items())).copy()
+
+def _read_categories(path=CATEGORIES_PATH):
+    """
+    Returns the ['buisness_name', 'category'] columns of the categories workbook,
+    as a copy of the frame cached per (path, mtime).
+    """
+    return _parse_excel(path, os.path.getmtime(path), tuple(CATEGORIES_DTYPES.items())).copy()
+
+def _load_with_parquet_cache(path, read_excel, dtypes):
+    """
+    Returns read_excel(path), going through a '<name>.parquet' sidecar:
+      - If the sidecar is at least as new as 'path' and has the 'dtypes'
+        columns, read it instead.
+      - Otherwise (or if the sidecar can't be read) parse the workbook and
+        (re)write the sidecar, if the folder allows it.
+    The sidecar is written to a temp file and renamed into place, so an
+    interrupted write never leaves a truncated '.parquet' behind.
+    Without pyarrow the workbook is always parsed directly.
+    """
+    if pyarrow is None:
+        return read_excel(path)
+
+    cache = os.path.splitext(path)[0] + '.parquet'
+    src_mtime = os.stat(path).st_mtime
+    if os.path.exists(cache) and os.stat(cache).st_mtime >= src_mtime:
+        try:
+            df = pd.read_parquet(cache, engine='pyarrow')
+        except (OSError, pyarrow.lib.ArrowException) as e:
+            # Corrupted sidecar - fall back to the workbook and rewrite it
+            print(f"[INFO] Could not read {cache}, re-parsing {path}: {e}")
+        else:
+            # A sidecar written with other dtypes (older version) is stale too
+            if df.dtypes.astype(str).to_dict() == dtypes:
+                return df
+
+    df = read_excel(path)
+    tmp = cache + '.tmp'
+    try:
+        df.to_parquet(tmp, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp, cache)
+    except (OSError, pyarrow.lib.ArrowException) as e:
+        # The cache is only an optimization (e.g. read-only folder, no zstd
+        # codec in this pyarrow build) - drop any partial file and keep going
+        print(f"[INFO] Could not write {cache}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    return df
+
+def load_expenses(path=EXPENSES_PATH):
+    return _load_with_parquet_cache(path, _read_expenses, EXPENSES_DTYPES)
+
+def load_categories(path=CATEGORIES_PATH):
+    return _load_with_parquet_cache(path, _read_categories, CATEGORIES_DTYPES)
+
+def main(save=HEADLESS):
     plot_by_business = False
 
     """
@@ -256,101 +423,171 @@ def main():
     3. Merge categories if available -> aggregate by 'category'.
        - Build a dictionary of each category's business breakdown.
        - Show interactive bar chart (naive reversing Hebrew text on click).
+    All charts share one figure (a bar + pie row per aggregation), shown once
+    at the end - or with save=True written as a PNG (Agg backend, no GUI).
     """
-    with open("output.txt", "w", encoding="utf-8") as f:
+    if save:
+        # Select the backend before pyplot is (lazily) imported
+        import matplotlib
+        matplotlib.use('Agg')
+    _mpl()
+    n_rows = 2 if plot_by_business else 1
+    fig, axes = plt.subplots(n_rows, 2, figsize=(16, 5 * n_rows), squeeze=False, layout='constrained')
+    # Last row is always Category; the first one is Business Name when enabled
+    biz_axes, cat_axes = axes[0], axes[-1]
+
+    # The report is collected in memory and written to output.txt in one go
+    report = []
+
+    # --- 1) Read & Filter Expenses ---
+    df_expenses = load_expenses()
+    # Drop blank/NaN and zero expenses in one pass over the column
+    te = df_expenses['total_expense'].to_numpy()
+    df_expenses = df_expenses[np.isfinite(te) & (te != 0)]
+    # Categorical names from here on: the groupbys below hash small integer codes
+    df_expenses = df_expenses.assign(buisness_name=df_expenses['buisness_name'].astype('category'))
+    # (Optional) remove negatives if not allowed:
+    # df_expenses = df_expenses[df_expenses['total_expense'] > 0]
+
+    if plot_by_business:
+        # --- 2) Aggregate by BUSINESS NAME ---
+        df_by_business = (
+            df_expenses
+            .groupby('buisness_name', as_index=False, sort=False, observed=True)['total_expense']
+            .sum()
+        )
+        # Only the small aggregated frame is sorted; name breaks ties deterministically
+        df_by_business.sort_values(
+            ['total_expense', 'buisness_name'],
+            ascending=[False, True],
+            inplace=True
+        )
 
-        # --- 1) Read & Filter Expenses ---
-        df_expenses = pd.read_excel('input_expenses.xlsx')
-        df_expenses.dropna(subset=['total_expense'], inplace=True)
-        df_expenses = df_expenses[df_expenses['total_expense'] != 0]
-        # (Optional) remove negatives if not allowed:
-        # df_expenses = df_expenses[df_expenses['total_expense'] > 0]
-
-        if plot_by_business:
-            # --- 2) Aggregate by BUSINESS NAME ---
-            f.write("=== 1) Aggregation by Business Name ===\n")
-            df_by_business = (
-                df_expenses
-                .groupby('buisness_name', as_index=False)['total_expense']
-                .sum()
-            )
-            df_by_business.sort_values('total_expense', ascending=False, inplace=True)
-
-            for _, row_biz in df_by_business.iterrows():
-                val_str = format_int_no_decimals(row_biz['total_expense'])
-                f.write(f"Business: {row_biz['buisness_name']}, Total: {val_str}\n")
-
-            # Plot bar + fraction-pie
-            plot_bar_chart(
-                labels=df_by_business['buisness_name'],
-                values=df_by_business['total_expense'],
-                title_label="Business Name"
-            )
-            plot_fraction_pie(
-                labels=df_by_business['buisness_name'],
-                values=df_by_business['total_expense'],
-                title_label="Business Name"
-            )
-
-        # --- 3) Aggregate by CATEGORY ---
-        f.write("\n=== 2) Aggregation by Category ===\n")
-
-        # Merge with categories if available
-        if os.path.exists('categories.xlsx'):
-            df_categories = pd.read_excel('categories.xlsx')
-            df_merged = df_expenses.merge(df_categories, on='buisness_name', how='left')
-            df_merged['category'] = df_merged['category'].fillna('Other')
-        else:
-            df_merged = df_expenses.copy()
-            df_merged['category'] = 'Other'
+        # Plain contiguous arrays, shared by the report lines and both charts
+        biz_labels = df_by_business['buisness_name'].to_numpy(dtype=object)
+        biz_values = df_by_business['total_expense'].to_numpy(dtype=np.float64, copy=True)
+
+        lines = (
+            'Business: ' + df_by_business['buisness_name'].astype(str)
+            + ', Total: ' + format_series(df_by_business['total_expense'])
+            + '\n'
+        )
+        report.append("=== 1) Aggregation by Business Name ===\n" + lines.str.cat())
+
+        # Plot bar + fraction-pie
+        plot_bar_chart(
+            labels=biz_labels,
+            values=biz_values,
+            title_label="Business Name",
+            ax=biz_axes[0]
+        )
+        plot_fraction_pie(
+            labels=biz_labels,
+            values=biz_values,
+            title_label="Business Name",
+            ax=biz_axes[1]
+        )
+
+    # --- 3) Aggregate by CATEGORY ---
+    # Look up each business's category if available
+    if os.path.exists(CATEGORIES_PATH):
+        df_categories = load_categories()
+        # First entry wins if a business is listed twice in categories.xlsx
+        df_categories = df_categories.drop_duplicates('buisness_name')
+        cat_map = dict(zip(df_categories['buisness_name'], df_categories['category']))
+        df_merged = df_expenses.assign(
+            category=df_expenses['buisness_name'].map(cat_map).fillna('Other').astype('category')
+        )
 
         df_by_category = (
             df_merged
-            .groupby('category', as_index=False)['total_expense']
+            .groupby('category', as_index=False, sort=False, observed=True)['total_expense']
             .sum()
         )
-        
-        df_by_category_not_sorted = df_by_category.copy()
-        df_by_category.sort_values('total_expense', ascending=False, inplace=True)
-
-        category_details = {}
-        for _, row_cat in df_by_category.iterrows():
-            cat = row_cat['category']
-            cat_total = row_cat['total_expense']
-            cat_total_str = format_int_no_decimals(cat_total)
-            f.write(f"Category: {cat}, Total: {cat_total_str}\n")
-
-            # For each category, gather business breakdown
-            cat_df = (
-                df_merged[df_merged['category'] == cat]
-                .groupby('buisness_name', as_index=False)['total_expense']
-                .sum()
-                .sort_values('total_expense', ascending=False)
-            )
-
-            detail_list = []
-            for _, row_b in cat_df.iterrows():
-                biz_name = row_b['buisness_name']
-                biz_exp_str = format_int_no_decimals(row_b['total_expense'])
-                detail_list.append((biz_name, biz_exp_str))
-                f.write(f"\tBusiness: {biz_name} => {biz_exp_str}\n")
-
-            category_details[cat] = detail_list
-
-        # Now we have 'df_by_category' for the bar/pie, and 'category_details' for the popup
-        # Plot an interactive bar chart for Category
-        plot_bar_chart_with_details(
-            labels=df_by_category['category'],
-            values=df_by_category['total_expense'],
-            title_label="Category",
-            category_details=category_details
+        # Business breakdown of every category in one grouped pass
+        biz_totals = (
+            df_merged
+            .groupby(['category', 'buisness_name'], sort=False, as_index=False, observed=True)['total_expense']
+            .sum()
         )
-        # And a standard pie chart for Category
-        plot_fraction_pie(
-            labels=df_by_category['category'],
-            values=df_by_category['total_expense'],
-            title_label="Category"
+    else:
+        # Everything is 'Other' - aggregate directly instead of copying df_expenses
+        # (no rows, no 'Other' group - same as the groupby would give)
+        has_rows = not df_expenses.empty
+        df_by_category = pd.DataFrame({
+            'category': ['Other'] if has_rows else [],
+            'total_expense': [df_expenses['total_expense'].sum()] if has_rows else []
+        })
+        biz_totals = (
+            df_expenses
+            .groupby('buisness_name', sort=False, as_index=False, observed=True)['total_expense']
+            .sum()
         )
+        biz_totals.insert(0, 'category', 'Other')
+
+    df_by_category = df_by_category.sort_values(
+        ['total_expense', 'category'],
+        ascending=[False, True],
+        ignore_index=True
+    )
+
+    biz_totals.sort_values(
+        ['category', 'total_expense', 'buisness_name'],
+        ascending=[True, False, True],
+        inplace=True
+    )
+    # Format every business total in one call, then only slice per category
+    biz_totals['buisness_name'] = biz_totals['buisness_name'].astype(str)
+    biz_totals['total_str'] = format_series(biz_totals['total_expense'])
+    category_details = {
+        cat: list(zip(g['buisness_name'], g['total_str']))
+        for cat, g in biz_totals.groupby('category', sort=False, observed=True)
+    }
+
+    # Category section: a total line followed by its business breakdown
+    cat_lines = (
+        'Category: ' + df_by_category['category'].astype(str)
+        + ', Total: ' + format_series(df_by_category['total_expense'])
+        + '\n'
+    )
+    report.append("\n=== 2) Aggregation by Category ===\n")
+    for cat, cat_line in zip(df_by_category['category'], cat_lines):
+        report.append(cat_line)
+        report.extend(
+            f"\tBusiness: {biz_name} => {biz_exp_str}\n"
+            for (biz_name, biz_exp_str) in category_details.get(cat, [])
+        )
+    with open("output.txt", "w", encoding="utf-8") as f:
+        f.write("".join(report))
+
+    # Now we have 'df_by_category' for the bar/pie, and 'category_details' for the popup
+    cat_labels = df_by_category['category'].to_numpy(dtype=object)
+    cat_values = df_by_category['total_expense'].to_numpy(dtype=np.float64, copy=True)
+    # Plot an interactive bar chart for Category
+    plot_bar_chart_with_details(
+        labels=cat_labels,
+        values=cat_values,
+        title_label="Category",
+        category_details=category_details,
+        ax=cat_axes[0]
+    )
+    # And a standard pie chart for Category
+    plot_fraction_pie(
+        labels=cat_labels,
+        values=cat_values,
+        title_label="Category",
+        ax=cat_axes[1]
+    )
+
+    path = show_or_save(fig, "Expenses", "charts", save)
+    if path:
+        print(f"[INFO] Saved {path}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Aggregate house expenses by business and category.")
+    parser.add_argument(
+        '--save', action='store_true',
+        help="save the charts as PNG files instead of showing them (also enabled by HEADLESS=1)"
+    )
+    args = parser.parse_args()
+    main(save=args.save or HEADLESS)